@@ -2,11 +2,15 @@
 
 Бот который проверяет статус домашней работы.
 """
+import functools
 import logging
 import os
+import random
 import sys
 import time
 from http import HTTPStatus
+from logging.handlers import RotatingFileHandler
+from types import MappingProxyType
 
 import requests
 from requests import RequestException
@@ -14,6 +18,11 @@ from dotenv import load_dotenv
 from telebot import TeleBot
 from telebot.apihelper import ApiException
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from exceptions import (
     HomeworkStatusError,
     ResponseStatusError,
@@ -31,8 +40,10 @@ TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_PERIOD = 600
+MAX_RETRY_PERIOD = 3600
+API_TIMEOUT = (5, 30)
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
-HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+HEADERS = MappingProxyType({'Authorization': f'OAuth {PRACTICUM_TOKEN}'})
 
 
 HOMEWORK_VERDICTS = {
@@ -40,6 +51,7 @@ HOMEWORK_VERDICTS = {
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
+HOMEWORK_STATUSES = frozenset(HOMEWORK_VERDICTS)
 
 
 def check_tokens():
@@ -55,7 +67,7 @@ def check_tokens():
     }
 
     missing_tokens = [
-        token for token, value in required_tokens.items() if value is None
+        token for token, value in required_tokens.items() if not value
     ]
 
     if missing_tokens:
@@ -77,18 +89,18 @@ def send_message(bot, message):
     - экземпляр класса TeleBot
     - строку с текстом сообщения.
     """
-    logger.info(f'Запущена отправка сообщения: {message}.')
+    logger.info('Запущена отправка сообщения: %s.', message)
 
     try:
         bot.send_message(TELEGRAM_CHAT_ID, message)
     except ApiException as error:
-        logger.exception(f'Произошла ошибка API Telegram: {error}.')
+        logger.exception('Произошла ошибка API Telegram: %s.', error)
         return False
     except RequestException as error:
-        logger.exception(f'Произошла ошибка отправки запроса: {error}.')
+        logger.exception('Произошла ошибка отправки запроса: %s.', error)
         return False
     else:
-        logger.debug(f'Успешное выполнение отправки сообщения: {message}.')
+        logger.debug('Успешное выполнение отправки сообщения: %s.', message)
         return True
 
 
@@ -103,11 +115,12 @@ def get_api_answer(timestamp):
         'url': ENDPOINT,
         'headers': HEADERS,
         'params': {'from_date': timestamp},
+        'timeout': API_TIMEOUT,
     }
 
     try:
         response = requests.get(**payload)
-        logger.info(f'Направлен запрос к API:{payload}')
+        logger.info('Направлен запрос к API: %s', payload)
 
     except RequestException as error:
         raise ResponseStatusError(
@@ -126,8 +139,12 @@ def get_api_answer(timestamp):
         )
         raise ResponseStatusError(error_message) from None
 
-    logger.info(f'Успешный запрос к API: {payload}')
-    return response.json()
+    logger.info('Успешный запрос к API: %s', payload)
+    if orjson is not None:
+        api_answer = orjson.loads(response.content)
+    else:
+        api_answer = response.json()
+    return api_answer
 
 
 def check_response(response):
@@ -143,13 +160,12 @@ def check_response(response):
             f'Ожидался тип данных dict, получен {type(response).__name__}'
         )
 
-    if 'homeworks' not in response or 'current_date' not in response:
-        raise KeyError('Отсутствие ожидаемых ключей в ответе API.')
-
-    homeworks = response['homeworks']
-
-    if not homeworks:
-        logger.debug('Список домашних работ пуст / Статус не изменился.')
+    try:
+        homeworks, _ = response['homeworks'], response['current_date']
+    except KeyError as error:
+        raise KeyError(
+            f'Отсутствие ожидаемого ключа {error} в ответе API.'
+        ) from error
 
     if not isinstance(homeworks, list):
         raise TypeError(
@@ -157,9 +173,23 @@ def check_response(response):
             f'Ожидался тип данных list, получен {type(homeworks).__name__}'
         )
 
+    if not homeworks:
+        logger.debug('Список домашних работ пуст / Статус не изменился.')
+
     return homeworks
 
 
+@functools.lru_cache(maxsize=256)
+def get_status_message(homework_name, homework_status):
+    """Формирует сообщение об изменении статуса домашней работы.
+
+    Результат кэшируется по паре (название работы, статус):
+    словарь HOMEWORK_VERDICTS не меняется во время работы бота.
+    """
+    verdict = HOMEWORK_VERDICTS[homework_status]
+    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+
+
 def parse_status(homework):
     """Извлекает из информации о конкретной домашней работе статус этой работы.
 
@@ -174,13 +204,26 @@ def parse_status(homework):
     homework_name = homework['homework_name']
     homework_status = homework['status']
 
-    if homework_status not in HOMEWORK_VERDICTS:
+    if homework_status not in HOMEWORK_STATUSES:
         raise HomeworkStatusError(
             f'Неожиданный статус домашней работы: {homework_status}'
         )
 
-    verdict = HOMEWORK_VERDICTS[homework_status]
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+    return get_status_message(homework_name, homework_status)
+
+
+def get_retry_delay(error_count):
+    """Возвращает паузу перед следующим запросом к API.
+
+    При успешной работе пауза равна RETRY_PERIOD. После ошибок пауза
+    растёт экспоненциально (но не больше MAX_RETRY_PERIOD) и выбирается
+    случайно в этих пределах, чтобы не нагружать API во время сбоя.
+    """
+    if not error_count:
+        return RETRY_PERIOD
+    return random.uniform(
+        0, min(MAX_RETRY_PERIOD, RETRY_PERIOD * 2 ** error_count)
+    )
 
 
 def main():
@@ -188,7 +231,10 @@ def main():
     check_tokens()
     bot = TeleBot(token=TELEGRAM_TOKEN)
     timestamp = int(time.time())
+    last_message = None
     last_error_message = None
+    error_count = 0
+    next_poll = time.monotonic()
 
     while True:
         try:
@@ -196,26 +242,40 @@ def main():
             homeworks = check_response(response)
             if homeworks:
                 status = parse_status(homeworks[0])
-                send_message(bot, status)
+                if status != last_message and send_message(bot, status):
+                    last_message = status
             timestamp = response.get('current_date', timestamp)
+            error_count = 0
+            last_error_message = None
         except Exception as error:
+            error_count += 1
             message = f'Произошел сбой в работе программы: {error}'
             if message != last_error_message:
                 logger.error(message)
                 send_message(bot, message)
                 last_error_message = message
         finally:
-            time.sleep(RETRY_PERIOD)
+            if error_count:
+                next_poll = time.monotonic() + get_retry_delay(error_count)
+            else:
+                next_poll = max(next_poll + RETRY_PERIOD, time.monotonic())
+            retry_delay = round(next_poll - time.monotonic())
+            time.sleep(retry_delay)
 
 
 if __name__ == '__main__':
-    logger.setLevel(logging.DEBUG)
-    logger.addHandler(logging.FileHandler(f'{BASE_NAME}.log'))
-    logger.addHandler(logging.StreamHandler(sys.stdout))
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    for handler in logger.handlers:
-        handler.setFormatter(formatter)
+    file_handler = RotatingFileHandler(
+        f'{BASE_NAME}.log', maxBytes=5_000_000, backupCount=3
+    )
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(file_handler)
+    logger.addHandler(stream_handler)
 
     main()
@@ -4,6 +4,7 @@ import platform
 import re
 import time
 from http import HTTPStatus
+from types import SimpleNamespace
 
 import pytest
 import requests
@@ -825,3 +826,217 @@ class TestHomework:
     def test_docstrings(self, homework_module):
         for func in self.HOMEWORK_FUNC_WITH_PARAMS_QTY:
             check_utils.check_docstring(homework_module, func)
+
+    def test_get_retry_delay_without_errors(self, homework_module):
+        assert homework_module.get_retry_delay(0) == self.RETRY_PERIOD, (
+            'Без ошибок пауза между запросами должна быть равна '
+            '`RETRY_PERIOD`.'
+        )
+
+    @pytest.mark.parametrize('error_count', [1, 2, 3, 4, 10])
+    def test_get_retry_delay_after_errors(self, error_count, homework_module):
+        upper_bound = min(
+            homework_module.MAX_RETRY_PERIOD,
+            self.RETRY_PERIOD * 2 ** error_count
+        )
+        for _ in range(100):
+            delay = homework_module.get_retry_delay(error_count)
+            assert 0 <= delay <= upper_bound, (
+                'Пауза после ошибок должна лежать в пределах '
+                f'[0, {upper_bound}], получено {delay}.'
+            )
+
+    def test_get_retry_delay_is_capped(self, monkeypatch, homework_module):
+        monkeypatch.setattr(
+            homework_module.random, 'uniform', lambda low, high: high
+        )
+        delay = homework_module.get_retry_delay(100)
+        assert delay == homework_module.MAX_RETRY_PERIOD, (
+            'Пауза после длительного сбоя не должна превышать '
+            '`MAX_RETRY_PERIOD`.'
+        )
+
+    def run_main_loop(self, monkeypatch, homework_module, polls, clock=None):
+        """
+        Run main() until it has slept `polls` times and return the sleeps.
+        `clock` is a one-element list used as the value of time.monotonic().
+        """
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(
+            homework_module, 'TeleBot', check_utils.MockTelegramBot
+        )
+        clock = clock if clock is not None else [0.0]
+        sleeps = []
+
+        def mock_sleep(secs):
+            sleeps.append(secs)
+            clock[0] += secs
+            if len(sleeps) == polls:
+                raise check_utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(homework_module, 'time', SimpleNamespace(
+            time=time.time, sleep=mock_sleep, monotonic=lambda: clock[0]
+        ))
+        with pytest.raises(check_utils.BreakInfiniteLoop):
+            homework_module.main()
+        return sleeps
+
+    def test_main_does_not_resend_same_status(
+            self, monkeypatch, homework_module, data_with_new_hw_status
+    ):
+        sent_messages = []
+
+        def mock_send_message(bot, message):
+            sent_messages.append(message)
+            return True
+
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer',
+            lambda timestamp: data_with_new_hw_status
+        )
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        self.run_main_loop(monkeypatch, homework_module, polls=2)
+
+        assert len(sent_messages) == 1, (
+            'Убедитесь, что неизменившийся статус домашней работы '
+            'не отправляется в Telegram повторно.'
+        )
+
+    def test_main_resends_status_after_failed_send(
+            self, monkeypatch, homework_module, data_with_new_hw_status
+    ):
+        send_results = iter([False, True])
+        sent_messages = []
+
+        def mock_send_message(bot, message):
+            sent_messages.append(message)
+            return next(send_results)
+
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer',
+            lambda timestamp: data_with_new_hw_status
+        )
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        self.run_main_loop(monkeypatch, homework_module, polls=2)
+
+        assert len(sent_messages) == 2, (
+            'Убедитесь, что статус, который не удалось отправить, '
+            'отправляется повторно при следующем опросе.'
+        )
+
+    def test_get_api_answer_without_orjson(
+            self, monkeypatch, current_timestamp, homework_module
+    ):
+        monkeypatch.setattr(homework_module, 'orjson', None)
+
+        class MockResponseWithoutContent(check_utils.MockResponseGET):
+            @property
+            def content(self):
+                raise AssertionError(
+                    'Без orjson ответ API должен разбираться '
+                    'методом `response.json()`.'
+                )
+
+        def mock_response_get(*args, **kwargs):
+            return MockResponseWithoutContent(
+                *args, random_timestamp=current_timestamp, **kwargs
+            )
+
+        monkeypatch.setattr(requests, 'get', mock_response_get)
+        result = homework_module.get_api_answer(current_timestamp)
+        assert result == {'homeworks': [], 'current_date': current_timestamp}
+
+    @pytest.mark.parametrize('empty_token', ENV_VARS)
+    def test_check_tokens_with_empty_token(
+            self, monkeypatch, empty_token, homework_module
+    ):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(homework_module, empty_token, '')
+
+        with pytest.raises(EnvironmentError, match=empty_token):
+            homework_module.check_tokens()
+
+    def test_main_reports_repeated_error_after_recovery(
+            self, monkeypatch, homework_module, random_timestamp
+    ):
+        api_answers = iter([
+            homework_module.ResponseStatusError('API недоступен'),
+            {'homeworks': [], 'current_date': random_timestamp},
+            homework_module.ResponseStatusError('API недоступен'),
+        ])
+        sent_messages = []
+
+        def mock_get_api_answer(timestamp):
+            api_answer = next(api_answers)
+            if isinstance(api_answer, Exception):
+                raise api_answer
+            return api_answer
+
+        def mock_send_message(bot, message):
+            sent_messages.append(message)
+            return True
+
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer', mock_get_api_answer
+        )
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        self.run_main_loop(monkeypatch, homework_module, polls=3)
+
+        assert len(sent_messages) == 2, (
+            'Убедитесь, что ошибка, повторившаяся после успешного опроса, '
+            'снова отправляется в Telegram.'
+        )
+
+    def test_main_sleeps_backoff_delay_after_error(
+            self, monkeypatch, homework_module
+    ):
+        def mock_get_api_answer(timestamp):
+            raise homework_module.ResponseStatusError('API недоступен')
+
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer', mock_get_api_answer
+        )
+        monkeypatch.setattr(
+            homework_module, 'send_message', lambda bot, message: True
+        )
+        monkeypatch.setattr(
+            homework_module.random, 'uniform', lambda low, high: high
+        )
+        sleeps = self.run_main_loop(monkeypatch, homework_module, polls=2)
+
+        assert sleeps == [self.RETRY_PERIOD * 2, self.RETRY_PERIOD * 4], (
+            'Убедитесь, что после ошибки бот ждёт паузу, рассчитанную '
+            '`get_retry_delay()`, а не `RETRY_PERIOD`.'
+        )
+
+    def test_main_slow_poll_does_not_stretch_period(
+            self, monkeypatch, homework_module, random_timestamp
+    ):
+        clock = [0.0]
+        poll_times = []
+        work_time = 100
+
+        def mock_get_api_answer(timestamp):
+            poll_times.append(clock[0])
+            clock[0] += work_time
+            return {'homeworks': [], 'current_date': random_timestamp}
+
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer', mock_get_api_answer
+        )
+        sleeps = self.run_main_loop(
+            monkeypatch, homework_module, polls=2, clock=clock
+        )
+
+        assert sleeps == [self.RETRY_PERIOD - work_time] * 2, (
+            'Убедитесь, что время выполнения запроса вычитается из паузы '
+            'до следующего опроса.'
+        )
+        assert poll_times == [0, self.RETRY_PERIOD], (
+            'Убедитесь, что опросы API выполняются ровно раз '
+            'в `RETRY_PERIOD` секунд.'
+        )